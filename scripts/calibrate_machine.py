@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+추론 시간 하드웨어 정규화 스크립트
+
+conv / transformer 추론과 비슷한 고정 NumPy 워크로드(캘리브레이션 마이크로벤치마크)를
+BLAS 단일 스레드로 실행해서 머신의 코어당 속도 점수(calibration_score, 워크로드 실행 횟수/초)와
+머신 지문(fingerprint)을 측정합니다.
+
+측정한 점수를 각 벤치마크 결과의 timing 항목에 원본 추론 시간과 함께 기록하고,
+results.json의 reference_machine 점수를 기준으로 정규화된 추론 시간을 계산합니다.
+
+    normalized_inference_time_ms = inference_time_ms * (calibration_score / reference_score)
+
+서로 다른 호스트에서 측정한 모델도 정규화된 시간으로 함께 비교할 수 있습니다.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# 코어 수가 다른 호스트끼리 비교할 수 있도록 BLAS를 단일 스레드로 고정 (numpy import 전에 설정해야 적용됨)
+CALIBRATION_THREADS = 1
+for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "BLIS_NUM_THREADS",
+            "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS"):
+    os.environ[var] = str(CALIBRATION_THREADS)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # numpy가 이미 import된 상태(다른 스크립트에서 모듈로 사용)에서도 스레드 수를 제한
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+
+# 워크로드 크기 (1초 오디오 기준 소형 conv-transformer 모델과 비슷한 규모)
+NUM_FRAMES = 256
+CONV_CHANNELS = 128
+CONV_KERNEL = 3
+CONV_LAYERS = 4
+D_MODEL = 256
+FFN_DIM = 1024
+NUM_HEADS = 4
+
+
+def load_json(path: Path) -> dict:
+    """JSON 파일 로드"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_json(path: Path, data: dict) -> None:
+    """JSON 파일 저장 (2-space indent)"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def make_weights(seed: int = 0) -> dict:
+    """고정 시드로 워크로드 가중치 생성 (float32)"""
+    rng = np.random.default_rng(seed)
+
+    def randn(*shape):
+        return (rng.standard_normal(shape) / np.sqrt(shape[0])).astype(np.float32)
+
+    return {
+        "input": rng.standard_normal((NUM_FRAMES, CONV_CHANNELS)).astype(np.float32),
+        "conv": [randn(CONV_CHANNELS * CONV_KERNEL, CONV_CHANNELS) for _ in range(CONV_LAYERS)],
+        "proj": randn(CONV_CHANNELS, D_MODEL),
+        "qkv": randn(D_MODEL, 3 * D_MODEL),
+        "out": randn(D_MODEL, D_MODEL),
+        "ffn1": randn(D_MODEL, FFN_DIM),
+        "ffn2": randn(FFN_DIM, D_MODEL),
+    }
+
+
+def run_workload(w: dict) -> float:
+    """conv 스택 + transformer 블록 1회 실행 (결과 체크섬 반환 - 연산이 생략되지 않도록)"""
+    x = w["input"]
+
+    # 1D conv (im2col + matmul) + ReLU
+    for kernel in w["conv"]:
+        padded = np.pad(x, ((CONV_KERNEL // 2, CONV_KERNEL // 2), (0, 0)))
+        cols = np.lib.stride_tricks.sliding_window_view(padded, CONV_KERNEL, axis=0)
+        x = np.maximum(cols.reshape(NUM_FRAMES, -1) @ kernel, 0)
+
+    # Multi-head self-attention
+    h = x @ w["proj"]
+    q, k, v = np.split(h @ w["qkv"], 3, axis=1)
+    head_dim = D_MODEL // NUM_HEADS
+    q = q.reshape(NUM_FRAMES, NUM_HEADS, head_dim).transpose(1, 0, 2)
+    k = k.reshape(NUM_FRAMES, NUM_HEADS, head_dim).transpose(1, 2, 0)
+    v = v.reshape(NUM_FRAMES, NUM_HEADS, head_dim).transpose(1, 0, 2)
+    scores = (q @ k) / np.float32(np.sqrt(head_dim))
+    scores = np.exp(scores - scores.max(axis=-1, keepdims=True))
+    scores /= scores.sum(axis=-1, keepdims=True)
+    attn = (scores @ v).transpose(1, 0, 2).reshape(NUM_FRAMES, D_MODEL)
+    h = h + attn @ w["out"]
+
+    # Feed-forward (tanh 근사 GELU)
+    f = h @ w["ffn1"]
+    f = 0.5 * f * (1 + np.tanh(0.7978845608 * (f + 0.044715 * f ** 3)))
+    h = h + f @ w["ffn2"]
+
+    return float(h.sum())
+
+
+def run_calibration(repeats: int = 20, warmup: int = 3) -> float:
+    """
+    캘리브레이션 워크로드 실행
+
+    Returns:
+        calibration_score (워크로드 실행 횟수/초, 중앙값 기준 - 클수록 빠른 머신)
+    """
+    if np is None:
+        print("Error: numpy package is required for calibration. Install with: pip install numpy")
+        sys.exit(1)
+
+    weights = make_weights()
+    limits = threadpool_limits(CALIBRATION_THREADS) if threadpool_limits else contextlib.nullcontext()
+    with limits:
+        for _ in range(warmup):
+            run_workload(weights)
+
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run_workload(weights)
+            timings.append(time.perf_counter() - start)
+    return round(1.0 / float(np.median(timings)), 2)
+
+
+def cpu_model() -> str:
+    """CPU 모델명 (Linux는 /proc/cpuinfo, 그 외에는 platform 정보)"""
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def machine_info(score: float) -> dict:
+    """현재 머신 정보 + 지문 생성"""
+    cpu = cpu_model()
+    identity = [cpu, platform.machine(), platform.system(), os.cpu_count(), np.__version__]
+    return {
+        "fingerprint": hashlib.sha256(json.dumps(identity).encode("utf-8")).hexdigest()[:12],
+        "cpu": cpu,
+        "cpu_count": os.cpu_count(),
+        "threads": CALIBRATION_THREADS,
+        "calibration_score": score,
+        "measured_date": datetime.now().strftime("%Y-%m-%d"),
+    }
+
+
+def normalize(timing: dict, reference: dict | None) -> None:
+    """timing 항목의 정규화된 추론 시간 계산 (기준 머신이 없으면 생략)"""
+    if reference is None:
+        timing.pop("normalized_inference_time_ms", None)
+        return
+    ratio = timing["machine"]["calibration_score"] / reference["calibration_score"]
+    timing["normalized_inference_time_ms"] = round(timing["inference_time_ms"] * ratio, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Calibrate machine speed and normalize inference times in results.json",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Print this machine's calibration score and fingerprint
+  python calibrate_machine.py
+
+  # On the reference machine: record it as the normalization reference
+  python calibrate_machine.py --set-reference
+
+  # After timing a model on this machine: record raw + normalized time
+  python calibrate_machine.py --model sori-realtime-4.8m-62ms \\
+    --benchmark maestro-v3-test --inference-time 12.5
+
+  # Recompute normalized times (e.g., after changing the reference)
+  python calibrate_machine.py --normalize
+        """,
+    )
+    parser.add_argument("--model", "-m", help="Model ID of the result to attach timing to")
+    parser.add_argument("--benchmark", "-b", help="Benchmark ID of the result to attach timing to")
+    parser.add_argument(
+        "--inference-time", type=float, help="Measured inference time in ms per second of audio"
+    )
+    parser.add_argument(
+        "--set-reference",
+        action="store_true",
+        help="Record this machine as the reference machine",
+    )
+    parser.add_argument(
+        "--normalize",
+        action="store_true",
+        help="Recompute normalized inference times without running the benchmark",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=20, help="Number of timed workload runs (default: 20)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be changed without modifying the file",
+    )
+
+    args = parser.parse_args()
+
+    timing_args = [args.model, args.benchmark, args.inference_time]
+    if any(a is not None for a in timing_args) and not all(a is not None for a in timing_args):
+        parser.error("--model, --benchmark and --inference-time must be given together")
+
+    # 경로 설정
+    root_dir = Path(__file__).parent.parent
+    results_path = root_dir / "data" / "benchmarks" / "results.json"
+
+    # 데이터 로드
+    try:
+        data = load_json(results_path)
+    except FileNotFoundError:
+        print(f"Error: {results_path} not found")
+        sys.exit(1)
+
+    # 캘리브레이션 (정규화만 하는 경우 생략)
+    machine = None
+    if not args.normalize or args.set_reference or args.model:
+        print(f"Running calibration workload ({args.repeats} runs)...")
+        machine = machine_info(run_calibration(args.repeats))
+        print(json.dumps(machine, indent=2, ensure_ascii=False))
+        reference = data.get("reference_machine")
+        if reference:
+            speed = machine["calibration_score"] / reference["calibration_score"]
+            print(f"Speed relative to reference ({reference.get('cpu', reference['fingerprint'])}): {speed:.2f}x")
+        print()
+
+    if not (args.set_reference or args.model or args.normalize):
+        return
+
+    if args.set_reference:
+        data["reference_machine"] = machine
+        print("Reference machine updated")
+
+    if args.model:
+        # 같은 model + benchmark 조합 중 마지막 결과에 기록
+        matches = [
+            r for r in data["benchmark_results"]
+            if r["model_id"] == args.model and r["benchmark_id"] == args.benchmark
+        ]
+        if not matches:
+            print(f"Error: No result found for {args.model} on {args.benchmark}")
+            sys.exit(1)
+        matches[-1]["timing"] = {
+            "inference_time_ms": args.inference_time,
+            "machine": machine,
+        }
+        print(f"Timing recorded for {args.model} on {args.benchmark}")
+
+    # 모든 timing 항목 정규화 (기준 머신 점수가 바뀌면 전부 다시 계산해야 함)
+    reference = data.get("reference_machine")
+    if reference is None:
+        print("Warning: No reference_machine in results.json, normalized times not computed")
+        print("Run with --set-reference on the reference machine first")
+    normalized = 0
+    for result in data["benchmark_results"]:
+        if "timing" in result:
+            normalize(result["timing"], reference)
+            normalized += "normalized_inference_time_ms" in result["timing"]
+    print(f"Normalized {normalized} timing result(s)")
+
+    if args.dry_run:
+        print("Dry run - no changes made")
+        return
+
+    save_json(results_path, data)
+    print(f"Saved to {results_path}")
+
+
+if __name__ == "__main__":
+    main()
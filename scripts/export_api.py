@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+정적 JSON API 내보내기 스크립트
+
+data/benchmarks/results.json을 읽어서 클라이언트가 필요한 뷰만 받아갈 수 있도록
+정적 API 트리를 생성합니다.
+
+    <output>/index.json                  - 전체 파일 목록과 콘텐츠 해시 (ETag)
+    <output>/benchmarks/<id>.json        - 벤치마크별 결과 + 메트릭별 정렬 순위
+    <output>/models/<id>.json            - 모델별 정보 + 벤치마크 결과
+
+각 파일은 .gz 압축본과 (brotli 패키지가 설치된 경우) .br 압축본을 함께 생성하며,
+콘텐츠 해시가 바뀐 파일만 다시 씁니다.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+API_VERSION = 1
+
+# 메트릭 그룹 / 세부 메트릭 - README 테이블과 동일한 순서
+METRIC_GROUPS = [
+    "note",
+    "note_with_velocity",
+    "note_with_offsets",
+    "note_with_offsets_and_velocity",
+]
+METRIC_FIELDS = ["f1", "precision", "recall"]
+
+
+def load_json(path: Path) -> dict:
+    """JSON 파일 로드"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def encode_json(data: dict) -> bytes:
+    """API 응답용 JSON 직렬화 (키 정렬, 공백 제거 - 해시가 안정적이도록)"""
+    return json.dumps(
+        data, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def content_hash(payload: bytes) -> str:
+    """콘텐츠 해시 (sha256 hex)"""
+    return hashlib.sha256(payload).hexdigest()
+
+
+def get_metric(result: dict, group: str, field: str):
+    """결과에서 메트릭 값 추출 (없으면 None)"""
+    return (result["metrics"].get(group) or {}).get(field)
+
+
+def build_rankings(results: list[dict]) -> dict:
+    """
+    메트릭별 정렬 순위 생성
+
+    값이 null인 결과는 해당 메트릭 순위에서 제외합니다.
+    timing.normalized_inference_time_ms 순위만 오름차순입니다.
+    """
+    rankings = {}
+    for group in METRIC_GROUPS:
+        for field in METRIC_FIELDS:
+            entries = [
+                {"model_id": r["model_id"], "value": get_metric(r, group, field)}
+                for r in results
+                if get_metric(r, group, field) is not None
+            ]
+            entries.sort(key=lambda x: x["value"], reverse=True)
+            rankings[f"{group}.{field}"] = entries
+
+    # 기준 머신으로 정규화된 추론 시간 (오름차순 - 빠를수록 상위)
+    entries = [
+        {"model_id": r["model_id"], "value": r["timing"]["normalized_inference_time_ms"]}
+        for r in results
+        if r.get("timing", {}).get("normalized_inference_time_ms") is not None
+    ]
+    entries.sort(key=lambda x: x["value"])
+    rankings["timing.normalized_inference_time_ms"] = entries
+    return rankings
+
+
+def build_views(results_data: dict) -> dict[str, dict]:
+    """API 경로 -> 응답 객체 매핑 생성 (index.json 제외)"""
+    models = {m["id"]: m for m in results_data["models"]}
+    views = {}
+
+    # 벤치마크별 뷰
+    for benchmark in results_data["benchmarks"]:
+        results = [
+            r for r in results_data["benchmark_results"]
+            if r["benchmark_id"] == benchmark["id"]
+        ]
+        # 기본 정렬은 README 테이블과 동일하게 note f1 내림차순
+        results.sort(
+            key=lambda r: get_metric(r, "note", "f1") or 0, reverse=True
+        )
+        views[f"benchmarks/{benchmark['id']}.json"] = {
+            "benchmark": benchmark,
+            "models": {
+                r["model_id"]: models[r["model_id"]]["name"] for r in results
+            },
+            "results": results,
+            "rankings": build_rankings(results),
+        }
+
+    # 모델별 뷰
+    for model in results_data["models"]:
+        views[f"models/{model['id']}.json"] = {
+            "model": model,
+            "results": [
+                r for r in results_data["benchmark_results"]
+                if r["model_id"] == model["id"]
+            ],
+        }
+
+    return views
+
+
+def compressed_variants(payload: bytes) -> dict[str, bytes]:
+    """사전 압축본 생성 (확장자 -> 바이트)"""
+    # mtime=0: 같은 입력이면 항상 같은 .gz가 나오도록
+    variants = {".gz": gzip.compress(payload, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(payload, quality=11)
+    return variants
+
+
+def variant_exts() -> list[str]:
+    """생성해야 하는 압축본 확장자"""
+    return [".gz", ".br"] if brotli is not None else [".gz"]
+
+
+def write_if_changed(path: Path, payload: bytes, old_digest: str | None = None, dry_run: bool = False) -> bool:
+    """
+    콘텐츠 해시가 바뀐 경우에만 파일과 압축본 저장
+
+    old_digest는 이전 index.json에 기록된 sha256이며, 없으면 기존 파일에서 계산합니다.
+    해시가 같으면 압축을 다시 하지 않습니다.
+
+    Returns:
+        파일을 (다시) 쓰거나 지웠는지 여부
+    """
+    changed = False
+
+    # brotli가 없으면 예전 .br은 현재 내용과 다를 수 있으므로 삭제
+    stale_br = path.with_name(path.name + ".br")
+    if brotli is None and stale_br.exists():
+        changed = True
+        if not dry_run:
+            stale_br.unlink()
+
+    if old_digest is None and path.exists():
+        old_digest = content_hash(path.read_bytes())
+    up_to_date = (
+        old_digest == content_hash(payload)
+        and path.exists()
+        and all(path.with_name(path.name + ext).exists() for ext in variant_exts())
+    )
+    if up_to_date:
+        return changed
+    if dry_run:
+        return True
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+    for ext, data in compressed_variants(payload).items():
+        path.with_name(path.name + ext).write_bytes(data)
+    return True
+
+
+def remove_stale(output_dir: Path, old_index: dict, new_files: dict, dry_run: bool) -> list[str]:
+    """이전 index.json에는 있었지만 더 이상 생성되지 않는 파일 삭제"""
+    removed = []
+    for rel_path in old_index.get("files", {}):
+        if rel_path in new_files:
+            continue
+        removed.append(rel_path)
+        if dry_run:
+            continue
+        path = output_dir / rel_path
+        for candidate in (path, path.with_name(path.name + ".gz"), path.with_name(path.name + ".br")):
+            if candidate.exists():
+                candidate.unlink()
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export static JSON API from results.json")
+    parser.add_argument(
+        "--output", "-o", type=Path, default=None,
+        help="Output directory (default: build/api)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show which files would be written without modifying anything",
+    )
+    args = parser.parse_args()
+
+    # 경로 설정
+    root_dir = Path(__file__).parent.parent
+    results_path = root_dir / "data" / "benchmarks" / "results.json"
+    output_dir = args.output or root_dir / "build" / "api"
+    index_path = output_dir / "index.json"
+
+    # 데이터 로드
+    try:
+        results_data = load_json(results_path)
+    except FileNotFoundError:
+        print(f"Error: {results_path} not found")
+        sys.exit(1)
+
+    try:
+        old_index = load_json(index_path)
+    except (FileNotFoundError, json.JSONDecodeError):
+        old_index = {}
+
+    # 뷰 생성 및 저장
+    files = {}
+    written = []
+    for rel_path, view in sorted(build_views(results_data).items()):
+        payload = encode_json(view)
+        digest = content_hash(payload)
+        files[rel_path] = {"sha256": digest, "etag": f'"{digest[:16]}"', "size": len(payload)}
+        old_digest = old_index.get("files", {}).get(rel_path, {}).get("sha256")
+        if write_if_changed(output_dir / rel_path, payload, old_digest, args.dry_run):
+            written.append(rel_path)
+
+    removed = remove_stale(output_dir, old_index, files, args.dry_run)
+
+    # index.json은 파일 해시만 담아서 데이터가 그대로면 바이트 단위로 동일하게 유지
+    index = {
+        "api_version": API_VERSION,
+        "data_version": results_data.get("version"),
+        "last_updated": results_data.get("last_updated"),
+        "benchmarks": [b["id"] for b in results_data["benchmarks"]],
+        "models": [m["id"] for m in results_data["models"]],
+        "files": files,
+    }
+    if write_if_changed(index_path, encode_json(index), dry_run=args.dry_run):
+        written.append("index.json")
+
+    prefix = "Would write" if args.dry_run else "Wrote"
+    print(f"{prefix} {len(written)} file(s), {len(files) + 1 - len(written)} unchanged")
+    for rel_path in written:
+        print(f"  - {rel_path}")
+    for rel_path in removed:
+        print(f"  - {rel_path} (removed)")
+    if brotli is None:
+        print("Note: brotli package not installed, skipping .br variants (pip install brotli)")
+    print(f"Output: {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
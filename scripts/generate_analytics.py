@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+음역/피치별 오류 분석 스크립트
+
+4개 집계 메트릭 그룹으로는 보이지 않는 실패 유형(저음역, 밀집 화음, 빠른 반복음)을 보기 위해
+모든 모델 x 모든 트랙의 노트 매칭 결과를 한 번에 모아 NumPy 히스토그램(bincount)으로
+다음 분석을 계산합니다. (onset 기준 매칭, Note F1과 동일한 ±50ms)
+
+- 피치별 (88건반, A0-C8) precision / recall
+- 음역(옥타브)별 precision / recall
+- 노트 밀도(±50ms 안에 동시에 시작하는 노트 수)별 precision / recall
+- 같은 피치 반복음의 inter-onset interval(IOI)별 precision / recall
+
+입력: data/analytics/notes/<benchmark-id>/<model-id>.npz (평가 파이프라인에서 생성)
+    ref_track, ref_pitch, ref_onset, ref_matched  - 정답 노트 (트랙 번호, MIDI 피치, onset 초, 매칭 여부)
+    est_track, est_pitch, est_onset, est_matched  - 예측 노트
+
+출력:
+    data/benchmarks/analytics.json               - 벤치마크/모델별 분석 결과 (results.json 확장)
+    assets/images/pitch_heatmap_<id>.png         - 모델 x 피치 precision / recall 히트맵
+    assets/images/error_breakdown_<id>.png       - 음역/밀도/IOI별 recall 히트맵
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy package is required. Install with: pip install numpy")
+    sys.exit(1)
+
+
+LOWEST_PITCH = 21  # A0
+NUM_KEYS = 88      # A0 - C8
+
+# 음역 구분 (이름, 최저 MIDI 피치) - 다음 음역 시작 전까지
+REGISTERS = [
+    ("A0-B1", 21),
+    ("C2-B2", 36),
+    ("C3-B3", 48),
+    ("C4-B4", 60),
+    ("C5-B5", 72),
+    ("C6-B6", 84),
+    ("C7-C8", 96),
+]
+
+# 노트 밀도: ±DENSITY_WINDOW_S 안에 시작하는 노트 수 (자기 자신 포함)
+DENSITY_WINDOW_S = 0.05
+DENSITY_EDGES = [2, 3, 4, 5, 7]
+DENSITY_LABELS = ["1", "2", "3", "4", "5-6", "7+"]
+
+# 같은 트랙/같은 피치의 직전 onset과의 간격 (ms)
+# 직전 같은 피치 onset이 없는 노트는 느린 반복음(>=500ms)과 섞이지 않도록 별도 구간
+IOI_EDGES_MS = [50, 100, 200, 500]
+IOI_LABELS = ["<50ms", "50-100ms", "100-200ms", "200-500ms", ">=500ms", "no repeat"]
+
+NOTE_FIELDS = ["track", "pitch", "onset", "matched"]
+
+
+def load_json(path: Path) -> dict:
+    """JSON 파일 로드"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_json(path: Path, data: dict) -> None:
+    """JSON 파일 저장 (2-space indent)"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def load_notes(paths: list[Path]) -> dict[str, dict[str, np.ndarray]]:
+    """
+    모델별 npz 파일을 읽어서 하나의 배열로 이어붙임
+
+    Returns:
+        {"ref": {...}, "est": {...}} - 각 필드 배열 + 모델 인덱스("model")
+    """
+    notes = {side: {field: [] for field in NOTE_FIELDS + ["model"]} for side in ("ref", "est")}
+    for model_idx, path in enumerate(paths):
+        with np.load(path) as npz:
+            for side in ("ref", "est"):
+                for field in NOTE_FIELDS:
+                    notes[side][field].append(npz[f"{side}_{field}"])
+                count = len(npz[f"{side}_pitch"])
+                notes[side]["model"].append(np.full(count, model_idx, dtype=np.int64))
+
+    return {
+        side: {
+            "model": np.concatenate(fields["model"]),
+            "track": np.concatenate(fields["track"]).astype(np.int64),
+            "pitch": np.concatenate(fields["pitch"]).astype(np.int64),
+            "onset": np.concatenate(fields["onset"]).astype(np.float64),
+            "matched": np.concatenate(fields["matched"]).astype(bool),
+        }
+        for side, fields in notes.items()
+    }
+
+
+def chord_size(model: np.ndarray, track: np.ndarray, onset: np.ndarray) -> np.ndarray:
+    """같은 모델/트랙에서 ±DENSITY_WINDOW_S 안에 시작하는 노트 수 (정렬 + searchsorted)"""
+    # (모델, 트랙) 별로 겹치지 않는 구간에 onset을 배치한 1차원 정수 키 (µs 단위)
+    # float 키는 그룹 오프셋에 따라 반올림이 달라져 정확히 ±50ms 떨어진 노트의 판정이 바뀌므로 int64 사용
+    onset_us = np.rint(onset * 1e6).astype(np.int64)
+    window_us = int(round(DENSITY_WINDOW_S * 1e6))
+    span = int(onset_us.max(initial=0)) + 2 * window_us + 1
+    key = (model * (track.max(initial=0) + 1) + track) * span + onset_us
+    order = np.argsort(key, kind="stable")
+    sorted_key = key[order]
+    lo = np.searchsorted(sorted_key, sorted_key - window_us, side="left")
+    hi = np.searchsorted(sorted_key, sorted_key + window_us, side="right")
+    size = np.empty(len(key), dtype=np.int64)
+    size[order] = hi - lo
+    return size
+
+
+def repeat_ioi_ms(model: np.ndarray, track: np.ndarray, pitch: np.ndarray, onset: np.ndarray) -> np.ndarray:
+    """같은 모델/트랙/피치의 직전 onset과의 간격 (ms, 첫 노트는 inf)"""
+    # 다중 키 lexsort 대신 (모델, 트랙, 피치) 그룹 + onset 1차원 키로 한 번만 정렬
+    group = (model * (track.max(initial=0) + 1) + track) * NUM_KEYS + (pitch - LOWEST_PITCH)
+    span = onset.max(initial=0.0) + 1.0
+    order = np.argsort(group * span + onset, kind="stable")
+    g, o = group[order], onset[order]
+    same = g[1:] == g[:-1]
+    sorted_ioi = np.full(len(order), np.inf)
+    sorted_ioi[1:][same] = np.diff(o)[same] * 1000
+    ioi = np.empty(len(order))
+    ioi[order] = sorted_ioi
+    return ioi
+
+
+def ioi_bins(ioi: np.ndarray) -> np.ndarray:
+    """IOI 구간 인덱스 (첫 노트(inf)는 마지막 "no repeat" 구간)"""
+    bins = np.digitize(ioi, IOI_EDGES_MS)
+    bins[np.isinf(ioi)] = len(IOI_LABELS) - 1
+    return bins
+
+
+def binned_counts(model: np.ndarray, bins: np.ndarray, matched: np.ndarray,
+                  num_models: int, num_bins: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (모델, 구간) 2차원 히스토그램
+
+    Returns:
+        (전체 노트 수, 매칭된 노트 수) - 각각 (num_models, num_bins) 배열
+    """
+    idx = model * num_bins + bins
+    size = num_models * num_bins
+    total = np.bincount(idx, minlength=size).reshape(num_models, num_bins)
+    hit = np.bincount(idx, weights=matched, minlength=size).reshape(num_models, num_bins)
+    return total, hit.astype(np.int64)
+
+
+def compute_breakdowns(notes: dict, num_models: int) -> dict[str, dict[str, np.ndarray]]:
+    """
+    모든 분석 구간별 (전체, 매칭) 노트 수 계산
+
+    Returns:
+        분석 이름 -> {"ref_total", "ref_hit", "est_total", "est_hit"} (num_models x 구간 수)
+    """
+    breakdowns = {"pitch": {}, "register": {}, "density": {}, "ioi": {}}
+    register_starts = [low - LOWEST_PITCH for _, low in REGISTERS]
+
+    for side, n in notes.items():
+        # 88건반 밖의 피치는 제외
+        in_range = (n["pitch"] >= LOWEST_PITCH) & (n["pitch"] < LOWEST_PITCH + NUM_KEYS)
+        n = {field: values[in_range] for field, values in n.items()}
+
+        bins = {
+            "pitch": (n["pitch"] - LOWEST_PITCH, NUM_KEYS),
+            "density": (
+                np.digitize(chord_size(n["model"], n["track"], n["onset"]), DENSITY_EDGES),
+                len(DENSITY_LABELS),
+            ),
+            "ioi": (
+                ioi_bins(repeat_ioi_ms(n["model"], n["track"], n["pitch"], n["onset"])),
+                len(IOI_LABELS),
+            ),
+        }
+        for name, (bin_idx, num_bins) in bins.items():
+            total, hit = binned_counts(n["model"], bin_idx, n["matched"], num_models, num_bins)
+            breakdowns[name][f"{side}_total"] = total
+            breakdowns[name][f"{side}_hit"] = hit
+
+        # 음역은 피치 히스토그램을 구간별로 합산
+        for kind in ("total", "hit"):
+            pitch_counts = breakdowns["pitch"][f"{side}_{kind}"]
+            breakdowns["register"][f"{side}_{kind}"] = np.add.reduceat(pitch_counts, register_starts, axis=1)
+
+    return breakdowns
+
+
+def percent(hit: np.ndarray, total: np.ndarray) -> np.ndarray:
+    """백분율 (노트가 없는 구간은 nan)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total > 0, 100.0 * hit / np.maximum(total, 1), np.nan)
+
+
+def to_list(values: np.ndarray) -> list:
+    """JSON 저장용 리스트 변환 (소수점 2자리, nan -> null)"""
+    return [None if np.isnan(v) else round(float(v), 2) for v in values]
+
+
+def summarize(breakdowns: dict, model_ids: list[str]) -> dict:
+    """분석 결과를 모델별 JSON 구조로 변환"""
+    models = {}
+    for i, model_id in enumerate(model_ids):
+        models[model_id] = {}
+        for name, counts in breakdowns.items():
+            models[model_id][name] = {
+                "precision": to_list(percent(counts["est_hit"][i], counts["est_total"][i])),
+                "recall": to_list(percent(counts["ref_hit"][i], counts["ref_total"][i])),
+                "support": counts["ref_total"][i].tolist(),
+            }
+    return models
+
+
+def plot_heatmaps(breakdowns: dict, model_names: list[str], benchmark: dict, images_dir: Path) -> list[Path]:
+    """모델 x 구간 히트맵 저장"""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    saved = []
+    height = 1.5 + 0.35 * len(model_names)
+
+    # 피치별 precision / recall
+    fig, axes = plt.subplots(2, 1, figsize=(16, 2 * height), sharex=True)
+    for ax, (title, side) in zip(axes, (("Precision", "est"), ("Recall", "ref"))):
+        counts = breakdowns["pitch"]
+        values = percent(counts[f"{side}_hit"], counts[f"{side}_total"])
+        im = ax.imshow(np.ma.masked_invalid(values), aspect="auto", cmap="viridis", vmin=0, vmax=100)
+        ax.set_title(f"Per-pitch Note {title} (%)", fontsize=13, fontweight="bold")
+        ax.set_yticks(range(len(model_names)))
+        ax.set_yticklabels(model_names, fontsize=10)
+        fig.colorbar(im, ax=ax, pad=0.01)
+    # C 음마다 눈금 (MIDI 24 = C1)
+    c_pitches = list(range(24, LOWEST_PITCH + NUM_KEYS, 12))
+    axes[-1].set_xticks([p - LOWEST_PITCH for p in c_pitches])
+    axes[-1].set_xticklabels([f"C{p // 12 - 1}" for p in c_pitches], fontsize=10)
+    axes[-1].set_xlabel("Pitch", fontsize=12, fontweight="bold")
+    fig.suptitle(benchmark["name"], fontsize=15, fontweight="bold")
+    path = images_dir / f"pitch_heatmap_{benchmark['id']}.png"
+    fig.savefig(path, dpi=150, bbox_inches="tight", facecolor="white")
+    plt.close(fig)
+    saved.append(path)
+
+    # 음역 / 밀도 / IOI별 recall
+    panels = [
+        ("register", "Recall by register", [name for name, _ in REGISTERS]),
+        ("density", "Recall by notes within ±50ms", DENSITY_LABELS),
+        ("ioi", "Recall by same-pitch inter-onset interval", IOI_LABELS),
+    ]
+    fig, axes = plt.subplots(1, 3, figsize=(18, height), sharey=True,
+                             gridspec_kw={"width_ratios": [len(labels) for _, _, labels in panels]})
+    for ax, (name, title, labels) in zip(axes, panels):
+        counts = breakdowns[name]
+        values = percent(counts["ref_hit"], counts["ref_total"])
+        ax.imshow(np.ma.masked_invalid(values), aspect="auto", cmap="viridis", vmin=0, vmax=100)
+        for (row, col), v in np.ndenumerate(values):
+            if not np.isnan(v):
+                ax.text(col, row, f"{v:.0f}", ha="center", va="center", fontsize=8,
+                        color="white" if v < 60 else "black")
+        ax.set_title(title, fontsize=12, fontweight="bold")
+        ax.set_xticks(range(len(labels)))
+        ax.set_xticklabels(labels, fontsize=9, rotation=30)
+        ax.set_yticks(range(len(model_names)))
+        ax.set_yticklabels(model_names, fontsize=10)
+    fig.suptitle(benchmark["name"], fontsize=15, fontweight="bold")
+    path = images_dir / f"error_breakdown_{benchmark['id']}.png"
+    fig.savefig(path, dpi=150, bbox_inches="tight", facecolor="white")
+    plt.close(fig)
+    saved.append(path)
+
+    return saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate per-pitch / per-register error analytics")
+    parser.add_argument(
+        "--input", type=Path, default=None,
+        help="Directory with <benchmark-id>/<model-id>.npz note matches (default: data/analytics/notes)",
+    )
+    parser.add_argument("--benchmark", "-b", help="Only analyze this benchmark ID")
+    parser.add_argument("--no-plot", action="store_true", help="Do not generate heatmap images")
+    args = parser.parse_args()
+
+    # 경로 설정
+    root_dir = Path(__file__).parent.parent
+    results_path = root_dir / "data" / "benchmarks" / "results.json"
+    analytics_path = root_dir / "data" / "benchmarks" / "analytics.json"
+    images_dir = root_dir / "assets" / "images"
+    input_dir = args.input or root_dir / "data" / "analytics" / "notes"
+
+    results_data = load_json(results_path)
+    model_names = {m["id"]: m["name"] for m in results_data["models"]}
+    benchmarks = [
+        b for b in results_data["benchmarks"]
+        if args.benchmark in (None, b["id"]) and (input_dir / b["id"]).is_dir()
+    ]
+    if not benchmarks:
+        print(f"Error: No note match files found in {input_dir}")
+        sys.exit(1)
+
+    # 기존 분석 결과에 덮어쓰기 (다른 벤치마크 결과는 유지)
+    try:
+        analytics = load_json(analytics_path)
+    except FileNotFoundError:
+        analytics = {}
+    analytics["last_updated"] = datetime.now().strftime("%Y-%m-%d")
+    analytics["bins"] = {
+        "pitch": {"lowest_midi_pitch": LOWEST_PITCH, "num_keys": NUM_KEYS},
+        "register": [name for name, _ in REGISTERS],
+        "density": DENSITY_LABELS,
+        "ioi": IOI_LABELS,
+    }
+    analytics.setdefault("benchmarks", {})
+
+    for benchmark in benchmarks:
+        # results.json의 모델 순서 유지
+        model_ids = [
+            m["id"] for m in results_data["models"]
+            if (input_dir / benchmark["id"] / f"{m['id']}.npz").exists()
+        ]
+        unknown = sorted(
+            p.stem for p in (input_dir / benchmark["id"]).glob("*.npz") if p.stem not in model_names
+        )
+        if unknown:
+            print(f"Warning: Skipping unknown models in {benchmark['id']}: {', '.join(unknown)}")
+        if not model_ids:
+            continue
+
+        notes = load_notes([input_dir / benchmark["id"] / f"{m}.npz" for m in model_ids])
+        breakdowns = compute_breakdowns(notes, len(model_ids))
+        analytics["benchmarks"][benchmark["id"]] = summarize(breakdowns, model_ids)
+        num_tracks = len(np.unique(notes["ref"]["track"]))
+        print(f"{benchmark['name']}: {len(model_ids)} models x {num_tracks} tracks, "
+              f"{len(notes['ref']['pitch']):,} reference / {len(notes['est']['pitch']):,} estimated notes")
+
+        if not args.no_plot:
+            images_dir.mkdir(parents=True, exist_ok=True)
+            for path in plot_heatmaps(breakdowns, [model_names[m] for m in model_ids], benchmark, images_dir):
+                print(f"  Plot saved to {path}")
+
+    save_json(analytics_path, analytics)
+    print(f"Analytics saved to {analytics_path}")
+
+
+if __name__ == "__main__":
+    main()
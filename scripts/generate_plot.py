@@ -9,16 +9,8 @@ import matplotlib.patches as mpatches
 from pathlib import Path
 import numpy as np
 
-def main():
-    # Path setup
-    root_dir = Path(__file__).parent.parent
-    results_path = root_dir / "data" / "benchmarks" / "results.json"
-    output_path = root_dir / "assets" / "images" / "note_f1_vs_delay.png"
-
-    # Load data
-    with open(results_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
+def render_plot(data: dict, output_path: Path) -> None:
+    """Render the Note F1 vs delay plot from parsed results.json data"""
     models = {m["id"]: m for m in data["models"]}
 
     # Extract data
@@ -201,9 +193,20 @@ def main():
     # Save
     output_path.parent.mkdir(parents=True, exist_ok=True)
     plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
-    print(f"Plot saved to {output_path}")
-
     plt.close()
 
+def main():
+    # Path setup
+    root_dir = Path(__file__).parent.parent
+    results_path = root_dir / "data" / "benchmarks" / "results.json"
+    output_path = root_dir / "assets" / "images" / "note_f1_vs_delay.png"
+
+    # Load data
+    with open(results_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    render_plot(data, output_path)
+    print(f"Plot saved to {output_path}")
+
 if __name__ == "__main__":
     main()
@@ -19,102 +19,120 @@ def load_json(path: Path) -> dict:
         return json.load(f)
 
 
-def generate_benchmark_table(results_data: dict) -> str:
-    """벤치마크 테이블 Markdown 생성"""
-    models = {m["id"]: m for m in results_data["models"]}
-    benchmarks = {b["id"]: b for b in results_data["benchmarks"]}
+# README 마커 섹션 (섹션 이름 -> (시작 마커, 끝 마커))
+SECTION_MARKERS = {
+    "benchmark_table": ("<!-- BENCHMARK_TABLE_START -->", "<!-- BENCHMARK_TABLE_END -->"),
+    "sample_gallery": ("<!-- SAMPLE_GALLERY_START -->", "<!-- SAMPLE_GALLERY_END -->"),
+    "last_updated": ("<!-- LAST_UPDATED_START -->", "<!-- LAST_UPDATED_END -->"),
+}
 
-    # 벤치마크별로 결과 그룹화
+
+def group_results_by_benchmark(results_data: dict) -> dict[str, list[dict]]:
+    """벤치마크별로 결과 그룹화 (처음 등장한 순서 유지)"""
     results_by_benchmark = {}
     for result in results_data["benchmark_results"]:
         bm_id = result["benchmark_id"]
         if bm_id not in results_by_benchmark:
             results_by_benchmark[bm_id] = []
         results_by_benchmark[bm_id].append(result)
+    return results_by_benchmark
+
 
+def generate_benchmark_table(results_data: dict) -> str:
+    """벤치마크 테이블 Markdown 생성"""
+    models = {m["id"]: m for m in results_data["models"]}
+    benchmarks = {b["id"]: b for b in results_data["benchmarks"]}
+
+    sections = [
+        generate_benchmark_section(benchmarks[benchmark_id], results, models)
+        for benchmark_id, results in group_results_by_benchmark(results_data).items()
+    ]
+    return "\n".join(sections)
+
+
+def generate_benchmark_section(benchmark: dict, results: list[dict], models: dict) -> str:
+    """벤치마크 하나의 테이블 + 상세 메트릭 Markdown 생성"""
     output_lines = []
 
-    for benchmark_id, results in results_by_benchmark.items():
-        benchmark = benchmarks[benchmark_id]
-        num_tracks = benchmark.get("num_tracks", "")
-        num_str = f" ({num_tracks}곡)" if num_tracks else ""
+    num_tracks = benchmark.get("num_tracks", "")
+    num_str = f" ({num_tracks}곡)" if num_tracks else ""
+
+    # Table header
+    num_str_en = f" ({num_tracks} tracks)" if num_tracks else ""
+    output_lines.append(f"### {benchmark['name']}{num_str_en}")
+    output_lines.append("")
+    output_lines.append("| Model | Note F1 | Note+Vel F1 | Note+Off F1 | Note+Off+Vel F1 | Params | Delay |")
+    output_lines.append("|:------|:-------:|:-----------:|:-----------:|:---------------:|:------:|:-----:|")
+
+    # note f1 기준 정렬 (내림차순)
+    sorted_results = sorted(
+        results,
+        key=lambda x: x["metrics"]["note"]["f1"],
+        reverse=True
+    )
 
-        # Table header
-        num_str_en = f" ({num_tracks} tracks)" if num_tracks else ""
-        output_lines.append(f"### {benchmark['name']}{num_str_en}")
-        output_lines.append("")
-        output_lines.append("| Model | Note F1 | Note+Vel F1 | Note+Off F1 | Note+Off+Vel F1 | Params | Delay |")
-        output_lines.append("|:------|:-------:|:-----------:|:-----------:|:---------------:|:------:|:-----:|")
-
-        # note f1 기준 정렬 (내림차순)
-        sorted_results = sorted(
-            results,
-            key=lambda x: x["metrics"]["note"]["f1"],
-            reverse=True
-        )
-
-        # 최고 성능 찾기 (소리 모델 중에서)
-        sori_results = [r for r in results if models[r["model_id"]].get("is_ours")]
-        best_f1 = max(r["metrics"]["note"]["f1"] for r in sori_results) if sori_results else 0
-
-        def fmt_metric(val):
-            """Format metric value, handling None/null"""
-            if val is None:
-                return "N/A"
-            return f"{val:.2f}"
-
-        for result in sorted_results:
-            model = models[result["model_id"]]
-            metrics = result["metrics"]
-
-            # 소리 모델이고 최고 성능이면 강조
-            is_best = metrics["note"]["f1"] == best_f1
-            name = f"**{model['name']}**" if model.get("is_ours") else model["name"]
-
-            # 메트릭 포맷팅
-            note_f1 = fmt_metric(metrics['note']['f1'])
-            note_vel_f1 = fmt_metric(metrics['note_with_velocity']['f1'])
-            note_off_f1 = fmt_metric(metrics['note_with_offsets']['f1'])
-            note_off_vel_f1 = fmt_metric(metrics['note_with_offsets_and_velocity']['f1'])
-
-            # 모델 정보
-            params_val = model.get('params_million')
-            if params_val:
-                if params_val < 0.1:
-                    params = f"{int(params_val * 1000)}K"
-                else:
-                    params = f"{params_val}M"
+    # 최고 성능 찾기 (소리 모델 중에서)
+    sori_results = [r for r in results if models[r["model_id"]].get("is_ours")]
+    best_f1 = max(r["metrics"]["note"]["f1"] for r in sori_results) if sori_results else 0
+
+    def fmt_metric(val):
+        """Format metric value, handling None/null"""
+        if val is None:
+            return "N/A"
+        return f"{val:.2f}"
+
+    for result in sorted_results:
+        model = models[result["model_id"]]
+        metrics = result["metrics"]
+
+        # 소리 모델이고 최고 성능이면 강조
+        is_best = metrics["note"]["f1"] == best_f1
+        name = f"**{model['name']}**" if model.get("is_ours") else model["name"]
+
+        # 메트릭 포맷팅
+        note_f1 = fmt_metric(metrics['note']['f1'])
+        note_vel_f1 = fmt_metric(metrics['note_with_velocity']['f1'])
+        note_off_f1 = fmt_metric(metrics['note_with_offsets']['f1'])
+        note_off_vel_f1 = fmt_metric(metrics['note_with_offsets_and_velocity']['f1'])
+
+        # 모델 정보
+        params_val = model.get('params_million')
+        if params_val:
+            if params_val < 0.1:
+                params = f"{int(params_val * 1000)}K"
             else:
-                params = "N/A"
-            delay = f"{model.get('delay_ms')}ms" if model.get('delay_ms') else "Offline"
+                params = f"{params_val}M"
+        else:
+            params = "N/A"
+        delay = f"{model.get('delay_ms')}ms" if model.get('delay_ms') else "Offline"
+
+        row = [name, note_f1, note_vel_f1, note_off_f1, note_off_vel_f1, params, delay]
+        output_lines.append("| " + " | ".join(row) + " |")
 
-            row = [name, note_f1, note_vel_f1, note_off_f1, note_off_vel_f1, params, delay]
-            output_lines.append("| " + " | ".join(row) + " |")
+    # Detailed metrics (Sori models only)
+    output_lines.append("")
+    output_lines.append("<details>")
+    output_lines.append("<summary>View Detailed Metrics</summary>")
+    output_lines.append("")
 
-        # Detailed metrics (Sori models only)
+    for result in sorted_results:
+        model = models[result["model_id"]]
+        if not model.get("is_ours"):
+            continue
+        metrics = result["metrics"]
+
+        output_lines.append(f"#### {model['name']}")
         output_lines.append("")
-        output_lines.append("<details>")
-        output_lines.append("<summary>View Detailed Metrics</summary>")
+        output_lines.append("| Metric | F1 | Precision | Recall |")
+        output_lines.append("|:-------|:--:|:---------:|:------:|")
+        output_lines.append(f"| Note (onset only) | {fmt_metric(metrics['note']['f1'])} | {fmt_metric(metrics['note']['precision'])} | {fmt_metric(metrics['note']['recall'])} |")
+        output_lines.append(f"| Note + Velocity | {fmt_metric(metrics['note_with_velocity']['f1'])} | {fmt_metric(metrics['note_with_velocity']['precision'])} | {fmt_metric(metrics['note_with_velocity']['recall'])} |")
+        output_lines.append(f"| Note + Offsets | {fmt_metric(metrics['note_with_offsets']['f1'])} | {fmt_metric(metrics['note_with_offsets']['precision'])} | {fmt_metric(metrics['note_with_offsets']['recall'])} |")
+        output_lines.append(f"| Note + Offsets + Velocity | {fmt_metric(metrics['note_with_offsets_and_velocity']['f1'])} | {fmt_metric(metrics['note_with_offsets_and_velocity']['precision'])} | {fmt_metric(metrics['note_with_offsets_and_velocity']['recall'])} |")
         output_lines.append("")
 
-        for result in sorted_results:
-            model = models[result["model_id"]]
-            if not model.get("is_ours"):
-                continue
-            metrics = result["metrics"]
-
-            output_lines.append(f"#### {model['name']}")
-            output_lines.append("")
-            output_lines.append("| Metric | F1 | Precision | Recall |")
-            output_lines.append("|:-------|:--:|:---------:|:------:|")
-            output_lines.append(f"| Note (onset only) | {fmt_metric(metrics['note']['f1'])} | {fmt_metric(metrics['note']['precision'])} | {fmt_metric(metrics['note']['recall'])} |")
-            output_lines.append(f"| Note + Velocity | {fmt_metric(metrics['note_with_velocity']['f1'])} | {fmt_metric(metrics['note_with_velocity']['precision'])} | {fmt_metric(metrics['note_with_velocity']['recall'])} |")
-            output_lines.append(f"| Note + Offsets | {fmt_metric(metrics['note_with_offsets']['f1'])} | {fmt_metric(metrics['note_with_offsets']['precision'])} | {fmt_metric(metrics['note_with_offsets']['recall'])} |")
-            output_lines.append(f"| Note + Offsets + Velocity | {fmt_metric(metrics['note_with_offsets_and_velocity']['f1'])} | {fmt_metric(metrics['note_with_offsets_and_velocity']['precision'])} | {fmt_metric(metrics['note_with_offsets_and_velocity']['recall'])} |")
-            output_lines.append("")
-
-        output_lines.append("</details>")
-        output_lines.append("")
+    output_lines.append("</details>")
+    output_lines.append("")
 
     return "\n".join(output_lines)
 
@@ -173,6 +191,25 @@ def update_readme_section(readme_content: str, start_marker: str, end_marker: st
     return before + "\n" + new_content + "\n" + after
 
 
+def read_readme_section(readme_content: str, name: str) -> str | None:
+    """README의 마커 섹션 내용 추출 (update_readme_section이 쓰는 형식 기준, 마커가 없으면 None)"""
+    start_marker, end_marker = SECTION_MARKERS[name]
+    start_idx = readme_content.find(start_marker)
+    end_idx = readme_content.find(end_marker)
+    if start_idx == -1 or end_idx == -1:
+        return None
+    content = readme_content[start_idx + len(start_marker):end_idx]
+    return content.removeprefix("\n").removesuffix("\n")
+
+
+def render_readme(readme_content: str, sections: dict[str, str]) -> str:
+    """주어진 섹션들(SECTION_MARKERS의 이름 -> 내용)만 README에 반영"""
+    for name, new_content in sections.items():
+        start_marker, end_marker = SECTION_MARKERS[name]
+        readme_content = update_readme_section(readme_content, start_marker, end_marker, new_content)
+    return readme_content
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate README from data files")
     parser.add_argument("--check", action="store_true", help="Check if README is up to date without modifying")
@@ -197,25 +234,11 @@ def main():
     sample_gallery = generate_sample_gallery(samples_data)
     last_updated = generate_last_updated(results_data)
     
-    new_readme = readme_content
-    new_readme = update_readme_section(
-        new_readme,
-        "<!-- BENCHMARK_TABLE_START -->",
-        "<!-- BENCHMARK_TABLE_END -->",
-        benchmark_table
-    )
-    new_readme = update_readme_section(
-        new_readme,
-        "<!-- SAMPLE_GALLERY_START -->",
-        "<!-- SAMPLE_GALLERY_END -->",
-        sample_gallery
-    )
-    new_readme = update_readme_section(
-        new_readme,
-        "<!-- LAST_UPDATED_START -->",
-        "<!-- LAST_UPDATED_END -->",
-        last_updated
-    )
+    new_readme = render_readme(readme_content, {
+        "benchmark_table": benchmark_table,
+        "sample_gallery": sample_gallery,
+        "last_updated": last_updated,
+    })
     
     if args.check:
         if new_readme != readme_content:
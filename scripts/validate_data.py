@@ -16,6 +16,10 @@ except ImportError:
     sys.exit(1)
 
 
+# samples.json에서 모델 결과를 담는 샘플 목록 키
+SAMPLE_LISTS = ["samples_gt_midi", "samples_musicxml"]
+
+
 def load_json(path: Path) -> dict:
     """JSON 파일 로드"""
     with open(path, "r", encoding="utf-8") as f:
@@ -29,8 +33,6 @@ def validate_file(data_path: Path, schema_path: Path) -> tuple[bool, list[str]]:
     Returns:
         (성공 여부, 에러 메시지 리스트)
     """
-    errors = []
-
     try:
         data = load_json(data_path)
     except FileNotFoundError:
@@ -46,38 +48,87 @@ def validate_file(data_path: Path, schema_path: Path) -> tuple[bool, list[str]]:
         return False, [f"Invalid JSON in schema {schema_path}: {e}"]
 
     # 스키마 검증
-    validator = Draft7Validator(schema)
+    errors = collect_schema_errors(data, Draft7Validator(schema))
+
+    return len(errors) == 0, errors
+
+
+def collect_schema_errors(data: dict, validator: Draft7Validator) -> list[str]:
+    """이미 로드된 데이터를 검증기로 검사해서 에러 메시지 리스트 반환"""
+    errors = []
     for error in validator.iter_errors(data):
         path = " -> ".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
         errors.append(f"[{path}] {error.message}")
-
-    return len(errors) == 0, errors
+    return errors
 
 
 def validate_references(results_path: Path, samples_path: Path) -> list[str]:
     """
     데이터 간 참조 무결성 검증
-    - samples.json의 algorithm_id가 results.json에 존재하는지 확인
+    - benchmark_results의 model_id / benchmark_id가 results.json에 존재하는지 확인
+    - samples.json의 results에서 참조하는 모델 ID가 results.json에 존재하는지 확인
     """
-    errors = []
-
     try:
         results_data = load_json(results_path)
         samples_data = load_json(samples_path)
     except (FileNotFoundError, json.JSONDecodeError):
         return []  # 파일 에러는 이미 validate_file에서 처리됨
 
-    # 유효한 algorithm ID 집합
-    valid_algorithms = {a["id"] for a in results_data.get("algorithms", [])}
+    return check_references(results_data, samples_data)
 
-    # samples.json의 results에서 참조하는 algorithm ID 확인
-    for sample in samples_data.get("samples", []):
-        for alg_id in sample.get("results", {}).keys():
-            if alg_id not in valid_algorithms:
+
+def dict_items(data: dict, key: str) -> list[dict]:
+    """
+    data[key] 목록에서 객체 항목만 반환
+
+    스키마 위반(목록이 아니거나 객체가 아닌 항목)은 스키마 검증에서 이미 보고되므로 건너뜁니다.
+    """
+    items = data.get(key) if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return []
+    return [item for item in items if isinstance(item, dict)]
+
+
+def check_references(results_data: dict, samples_data: dict) -> list[str]:
+    """이미 로드된 데이터 간 참조 무결성 검증"""
+    model_ids = {m.get("id") for m in dict_items(results_data, "models")}
+    benchmark_ids = {b.get("id") for b in dict_items(results_data, "benchmarks")}
+
+    errors = check_result_references(
+        dict_items(results_data, "benchmark_results"), model_ids, benchmark_ids
+    )
+    for key in SAMPLE_LISTS:
+        errors.extend(check_sample_references(dict_items(samples_data, key), model_ids))
+    return errors
+
+
+def check_result_references(results: list[dict], model_ids: set, benchmark_ids: set) -> list[str]:
+    """벤치마크 결과가 존재하는 모델/벤치마크를 참조하는지 확인"""
+    errors = []
+    for result in results:
+        if result.get("model_id") not in model_ids:
+            errors.append(
+                f"Result for '{result.get('benchmark_id')}' references unknown model '{result.get('model_id')}'"
+            )
+        if result.get("benchmark_id") not in benchmark_ids:
+            errors.append(
+                f"Result for '{result.get('model_id')}' references unknown benchmark '{result.get('benchmark_id')}'"
+            )
+    return errors
+
+
+def check_sample_references(samples: list[dict], model_ids: set) -> list[str]:
+    """샘플의 results가 존재하는 모델을 참조하는지 확인"""
+    errors = []
+    for sample in samples:
+        results = sample.get("results")
+        if not isinstance(results, dict):
+            continue  # 스키마 검증에서 보고됨
+        for model_id in results:
+            if model_id not in model_ids:
                 errors.append(
-                    f"Sample '{sample['id']}' references unknown algorithm '{alg_id}'"
+                    f"Sample '{sample.get('id')}' references unknown model '{model_id}'"
                 )
-
     return errors
 
 
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+변경분 기반 PR 검증 스크립트
+
+git base 리비전과 현재 작업 트리의 results.json / samples.json을 구조적으로 비교해서
+추가/변경된 모델, 벤치마크, 결과, 샘플만 스키마 검증하고
+그 변경이 건드리는 참조 무결성만 확인합니다.
+
+README는 영향받는 섹션(벤치마크별 테이블, 샘플 갤러리, 업데이트 날짜)만 다시 생성하고,
+나머지 섹션은 base 리비전의 README 또는 새로 생성한 내용과 동일한지 확인합니다.
+(base README가 데이터와 어긋나 있어도 generate_readme.py로 전체를 다시 생성하면 통과)
+스키마 파일이나 README 생성 스크립트 자체가 바뀐 경우에는 전체 검증으로 대체합니다.
+
+    python scripts/validate_pr.py --base origin/main
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from generate_readme import (
+    SECTION_MARKERS,
+    generate_benchmark_section,
+    generate_benchmark_table,
+    generate_last_updated,
+    generate_sample_gallery,
+    group_results_by_benchmark,
+    read_readme_section,
+)
+from validate_data import (
+    SAMPLE_LISTS,
+    Draft7Validator,
+    check_references,
+    check_result_references,
+    check_sample_references,
+    collect_schema_errors,
+    dict_items,
+)
+
+RESULTS_PATH = "data/benchmarks/results.json"
+SAMPLES_PATH = "data/samples/samples.json"
+BENCHMARK_SCHEMA_PATH = "data/schemas/benchmark.schema.json"
+SAMPLE_SCHEMA_PATH = "data/schemas/sample.schema.json"
+README_PATH = "README.md"
+# README 생성/검사 로직 - 바뀌면 영향 범위를 추정할 수 없으므로 전체 검증
+GENERATOR_PATHS = ["scripts/generate_readme.py", "scripts/validate_pr.py"]
+
+# 항목 단위로 비교하는 목록 (목록 키 -> ID 필드, None이면 항목 전체 내용으로 비교)
+RESULTS_LISTS = {"models": "id", "benchmarks": "id", "benchmark_results": None}
+SAMPLES_LISTS = {key: "id" for key in SAMPLE_LISTS}
+
+
+def git_show(root_dir: Path, base: str, rel_path: str) -> str | None:
+    """base 리비전의 파일 내용 (해당 리비전에 파일이 없으면 None)"""
+    proc = subprocess.run(
+        ["git", "show", f"{base}:{rel_path}"],
+        cwd=root_dir, capture_output=True, text=True, encoding="utf-8",
+    )
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
+
+
+def canonical(item) -> str:
+    """항목 비교용 정규화 JSON"""
+    return json.dumps(item, ensure_ascii=False, sort_keys=True)
+
+
+def diff_list(base_items: list, head_items: list, id_field: str | None) -> tuple[list[tuple[int, dict]], list]:
+    """
+    목록 구조 비교
+
+    Returns:
+        (추가/변경된 (head 인덱스, 항목) 리스트, 삭제된 항목 키 리스트)
+        id_field가 있으면 ID 기준, 없으면 항목 내용 기준 (중복 허용 multiset)으로 비교합니다.
+        ID 기준 비교에서 base보다 많이 등장하는 ID는 (내용이 같은 복사본이어도) 추가된 것으로 취급합니다.
+    """
+    if id_field is not None:
+        def item_id(item):
+            # 객체가 아닌 항목은 ID가 없으므로 항상 변경된 것으로 취급 (스키마 검증에서 보고됨)
+            return item.get(id_field) if isinstance(item, dict) else None
+
+        base_by_id = {}
+        base_counts = {}
+        for item in base_items:
+            if item_id(item) is not None:
+                base_by_id.setdefault(item_id(item), canonical(item))
+                base_counts[item_id(item)] = base_counts.get(item_id(item), 0) + 1
+        head_counts = {}
+        changed = []
+        for i, item in enumerate(head_items):
+            key = item_id(item)
+            if key is None:
+                changed.append((i, item))
+                continue
+            head_counts[key] = head_counts.get(key, 0) + 1
+            if head_counts[key] > base_counts.get(key, 0) or base_by_id[key] != canonical(item):
+                changed.append((i, item))
+        removed = [key for key in base_by_id if key not in head_counts]
+        return changed, removed
+
+    remaining = {}
+    for item in base_items:
+        key = canonical(item)
+        remaining[key] = remaining.get(key, 0) + 1
+    changed = []
+    for i, item in enumerate(head_items):
+        key = canonical(item)
+        if remaining.get(key, 0) > 0:
+            remaining[key] -= 1
+        else:
+            changed.append((i, item))
+    removed = [json.loads(key) for key, count in remaining.items() for _ in range(count)]
+    return changed, removed
+
+
+def diff_document(base: dict, head: dict, lists: dict) -> dict:
+    """문서 구조 비교 (최상위 스칼라 필드 + 목록별 추가/변경/삭제)"""
+    # 최상위가 객체가 아닌 문서는 빈 문서로 취급 (최상위 스키마 검증에서 보고됨)
+    base = base if isinstance(base, dict) else {}
+    head = head if isinstance(head, dict) else {}
+    diff = {
+        "fields": sorted(
+            key for key in (base.keys() | head.keys())
+            if key not in lists and base.get(key) != head.get(key)
+        ),
+    }
+    for key, id_field in lists.items():
+        # 목록이 아닌 값은 최상위 스키마 검증에서 보고됨
+        base_items = base.get(key) if isinstance(base.get(key), list) else []
+        head_items = head.get(key) if isinstance(head.get(key), list) else []
+        diff[key] = diff_list(base_items, head_items, id_field)
+    return diff
+
+
+def item_validators(schema: dict, lists: dict) -> dict:
+    """목록 키 -> 항목 스키마 검증기 (스키마의 items.$ref 정의 사용)"""
+    validators = {}
+    for key in lists:
+        item_schema = dict(schema["properties"][key]["items"])
+        item_schema["definitions"] = schema.get("definitions", {})
+        validators[key] = Draft7Validator(item_schema)
+    return validators
+
+
+def shallow_validator(schema: dict, lists: dict) -> Draft7Validator:
+    """목록 항목을 제외한 최상위 구조만 검사하는 검증기"""
+    shallow = dict(schema)
+    shallow["properties"] = {
+        key: {k: v for k, v in prop.items() if not (key in lists and k == "items")}
+        for key, prop in schema["properties"].items()
+    }
+    return Draft7Validator(shallow)
+
+
+def validate_changes(head: dict, diff: dict, schema: dict, lists: dict) -> list[str]:
+    """추가/변경된 항목과 최상위 구조만 스키마 검증"""
+    errors = collect_schema_errors(head, shallow_validator(schema, lists))
+    validators = item_validators(schema, lists)
+    for key in lists:
+        for index, item in diff[key][0]:
+            for e in collect_schema_errors(item, validators[key]):
+                # "[path] message" -> "[key -> index -> path] message"
+                path, message = e[1:].split("] ", 1)
+                path = f"{key} -> {index}" if path == "root" else f"{key} -> {index} -> {path}"
+                errors.append(f"[{path}] {message}")
+    return errors
+
+
+def validate_touched_references(results_data: dict, samples_data: dict, results_diff: dict, samples_diff: dict) -> list[str]:
+    """변경이 건드리는 참조 무결성만 확인"""
+    errors = []
+    changed_models, removed_models = results_diff["models"]
+    changed_benchmarks, removed_benchmarks = results_diff["benchmarks"]
+    added_results, _ = results_diff["benchmark_results"]
+
+    model_ids = {m.get("id") for m in dict_items(results_data, "models")}
+    benchmark_ids = {b.get("id") for b in dict_items(results_data, "benchmarks")}
+
+    # 추가/변경된 모델/벤치마크의 ID 중복
+    for key, changed in (("models", changed_models), ("benchmarks", changed_benchmarks)):
+        touched = {item.get("id") for _, item in changed if isinstance(item, dict)}
+        if not touched:
+            continue
+        seen = set()
+        for item in dict_items(results_data, key):
+            item_id = item.get("id")
+            if item_id in touched and item_id in seen:
+                errors.append(f"Duplicate {key[:-1]} id '{item_id}'")
+            seen.add(item_id)
+
+    # 새로 추가된 결과 -> 모델/벤치마크
+    errors.extend(check_result_references(
+        [r for _, r in added_results if isinstance(r, dict)], model_ids, benchmark_ids
+    ))
+
+    # 삭제된 모델/벤치마크를 아직 참조하는 결과/샘플
+    if removed_models or removed_benchmarks:
+        removed_model_set = set(removed_models)
+        removed_benchmark_set = set(removed_benchmarks)
+        dangling = [
+            r for r in dict_items(results_data, "benchmark_results")
+            if r.get("model_id") in removed_model_set or r.get("benchmark_id") in removed_benchmark_set
+        ]
+        errors.extend(check_result_references(dangling, model_ids, benchmark_ids))
+    for key in SAMPLE_LISTS:
+        changed_samples = [s for _, s in samples_diff[key][0] if isinstance(s, dict)]
+        if removed_models:
+            changed_ids = {s.get("id") for s in changed_samples}
+            changed_samples += [
+                s for s in dict_items(samples_data, key)
+                if s.get("id") not in changed_ids
+                and isinstance(s.get("results"), dict) and set(s["results"]) & set(removed_models)
+            ]
+        errors.extend(check_sample_references(changed_samples, model_ids))
+
+    return errors
+
+
+def affected_benchmarks(base: dict, head: dict, diff: dict) -> set[str]:
+    """README 테이블을 다시 생성해야 하는 벤치마크 ID"""
+    affected = set()
+    for result in [r for _, r in diff["benchmark_results"][0]] + diff["benchmark_results"][1]:
+        affected.add(result.get("benchmark_id"))
+    affected.update(b.get("id") for _, b in diff["benchmarks"][0])
+    affected.update(diff["benchmarks"][1])
+
+    touched_models = {m.get("id") for _, m in diff["models"][0]} | set(diff["models"][1])
+    if touched_models:
+        for data in (base, head):
+            for result in data.get("benchmark_results", []):
+                if result.get("model_id") in touched_models:
+                    affected.add(result.get("benchmark_id"))
+    return affected
+
+
+def split_benchmark_blocks(table: str, benchmark_ids: list[str]) -> dict[str, str] | None:
+    """
+    README 벤치마크 테이블 섹션을 벤치마크별 블록으로 분리
+
+    generate_benchmark_table은 블록을 "\\n"으로 이어붙이고 각 블록은 "### " 헤더로 시작합니다.
+    블록 수가 맞지 않으면 (base README가 데이터와 어긋난 경우) None을 반환합니다.
+    """
+    blocks = []
+    for line in table.split("\n"):
+        if line.startswith("### ") or not blocks:
+            blocks.append([])
+        blocks[-1].append(line)
+    blocks = ["\n".join(block) for block in blocks]
+    if not table or len(blocks) != len(benchmark_ids):
+        return None
+    return dict(zip(benchmark_ids, blocks))
+
+
+def expected_sections(base_results: dict, head_results: dict, head_samples: dict, base_readme: str,
+                      results_diff: dict, samples_diff: dict) -> tuple[dict[str, str], list[str]]:
+    """
+    변경 후 README 섹션 예상 내용 생성
+
+    Returns:
+        (섹션 이름 -> 예상 내용, 다시 생성한 항목 이름 리스트)
+        영향받지 않는 섹션/블록은 base README 내용을 그대로 사용합니다.
+    """
+    sections = {}
+    rebuilt = []
+
+    # 벤치마크 테이블
+    head_groups = group_results_by_benchmark(head_results)
+    affected = affected_benchmarks(base_results, head_results, results_diff)
+    base_table = read_readme_section(base_readme, "benchmark_table")
+    base_blocks = None
+    # base에 결과가 없으면 (스키마 변경으로 비웠거나 파일이 없던 경우) 블록 분리 없이 전체 재생성
+    if base_table is not None and base_results.get("benchmark_results"):
+        base_blocks = split_benchmark_blocks(base_table, list(group_results_by_benchmark(base_results)))
+    if base_blocks is None:
+        base_blocks = {}  # base README를 신뢰할 수 없으므로 전체 재생성
+    models = {m["id"]: m for m in head_results["models"]}
+    benchmarks = {b["id"]: b for b in head_results["benchmarks"]}
+    blocks = []
+    for benchmark_id, results in head_groups.items():
+        if benchmark_id in affected or benchmark_id not in base_blocks:
+            blocks.append(generate_benchmark_section(benchmarks[benchmark_id], results, models))
+            rebuilt.append(f"table:{benchmark_id}")
+        else:
+            blocks.append(base_blocks[benchmark_id])
+    sections["benchmark_table"] = "\n".join(blocks)
+
+    # 샘플 갤러리
+    if any(samples_diff[key][0] or samples_diff[key][1] for key in SAMPLE_LISTS) or samples_diff["fields"]:
+        sections["sample_gallery"] = generate_sample_gallery(head_samples)
+        rebuilt.append("sample_gallery")
+    elif read_readme_section(base_readme, "sample_gallery") is not None:
+        sections["sample_gallery"] = read_readme_section(base_readme, "sample_gallery")
+
+    # 마지막 업데이트 정보
+    if {"last_updated", "version"} & set(results_diff["fields"]):
+        sections["last_updated"] = generate_last_updated(head_results)
+        rebuilt.append("last_updated")
+    elif read_readme_section(base_readme, "last_updated") is not None:
+        sections["last_updated"] = read_readme_section(base_readme, "last_updated")
+
+    return sections, rebuilt
+
+
+def load_head(path: Path) -> dict:
+    """작업 트리의 JSON 파일 로드"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate only the data changed since a base git revision"
+    )
+    parser.add_argument(
+        "--base", required=True, help="Base git revision to diff against (e.g., origin/main)"
+    )
+    args = parser.parse_args()
+
+    root_dir = Path(__file__).parent.parent
+
+    if subprocess.run(["git", "rev-parse", "--verify", "--quiet", f"{args.base}^{{commit}}"],
+                      cwd=root_dir, capture_output=True).returncode != 0:
+        print(f"Error: Unknown base revision '{args.base}'")
+        sys.exit(1)
+
+    all_errors = []
+
+    # 데이터 로드 (head: 작업 트리, base: git 리비전)
+    try:
+        head_results = load_head(root_dir / RESULTS_PATH)
+        head_samples = load_head(root_dir / SAMPLES_PATH)
+        benchmark_schema = load_head(root_dir / BENCHMARK_SCHEMA_PATH)
+        sample_schema = load_head(root_dir / SAMPLE_SCHEMA_PATH)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    def load_base(rel_path: str) -> dict:
+        text = git_show(root_dir, args.base, rel_path)
+        try:
+            return json.loads(text) if text is not None else {}
+        except json.JSONDecodeError:
+            return {}  # base가 깨져 있으면 전체를 새로 추가된 것으로 취급
+
+    base_results = load_base(RESULTS_PATH)
+    base_samples = load_base(SAMPLES_PATH)
+
+    schema_changed = (
+        load_base(BENCHMARK_SCHEMA_PATH) != benchmark_schema
+        or load_base(SAMPLE_SCHEMA_PATH) != sample_schema
+    )
+    generator_changed = any(
+        git_show(root_dir, args.base, rel_path) != (root_dir / rel_path).read_text(encoding="utf-8")
+        for rel_path in GENERATOR_PATHS
+    )
+    if schema_changed or generator_changed:
+        # 스키마나 README 생성 로직이 바뀌면 모든 항목/섹션이 영향을 받으므로 base를 비워서 전체 검증
+        reason = "Schema" if schema_changed else "README generator"
+        print(f"{reason} changed since base revision, validating everything")
+        base_results, base_samples = {}, {}
+
+    results_diff = diff_document(base_results, head_results, RESULTS_LISTS)
+    samples_diff = diff_document(base_samples, head_samples, SAMPLES_LISTS)
+
+    print(f"Changes since {args.base}:")
+    for name, diff in ((RESULTS_PATH, results_diff), (SAMPLES_PATH, samples_diff)):
+        if diff["fields"]:
+            print(f"  {name}: fields changed: {', '.join(diff['fields'])}")
+        for key, value in diff.items():
+            if key == "fields":
+                continue
+            changed, removed = value
+            if changed or removed:
+                print(f"  {name}: {key}: {len(changed)} added/changed, {len(removed)} removed")
+    print()
+
+    # 스키마 검증 (변경분만)
+    print(f"Checking changed entries in {Path(RESULTS_PATH).name}...")
+    errors = validate_changes(head_results, results_diff, benchmark_schema, RESULTS_LISTS)
+    print(f"Checking changed entries in {Path(SAMPLES_PATH).name}...")
+    errors += validate_changes(head_samples, samples_diff, sample_schema, SAMPLES_LISTS)
+    all_errors.extend(errors)
+
+    # 참조 무결성 검증 (변경이 건드리는 참조만)
+    print("Checking touched cross-references...")
+    if schema_changed or generator_changed:
+        errors = check_references(head_results, head_samples)
+    else:
+        errors = validate_touched_references(head_results, head_samples, results_diff, samples_diff)
+    all_errors.extend(errors)
+
+    if all_errors:
+        print()
+        for e in all_errors:
+            print(f"    - {e}")
+        print()
+        print(f"Validation FAILED with {len(all_errors)} error(s)")
+        sys.exit(1)
+
+    # README 확인 (영향받는 섹션만 다시 생성)
+    print("Checking affected README sections...")
+    base_readme = git_show(root_dir, args.base, README_PATH) or ""
+    with open(root_dir / README_PATH, "r", encoding="utf-8") as f:
+        readme_content = f.read()
+    sections, rebuilt = expected_sections(
+        base_results, head_results, head_samples, base_readme, results_diff, samples_diff
+    )
+    # generate_readme.py로 전체를 다시 생성한 README도 허용
+    fresh = {
+        "benchmark_table": generate_benchmark_table(head_results),
+        "sample_gallery": generate_sample_gallery(head_samples),
+        "last_updated": generate_last_updated(head_results),
+    }
+    stale = [
+        SECTION_MARKERS[name][0] for name, content in sections.items()
+        if read_readme_section(readme_content, name) not in (None, content, fresh[name])
+    ]
+    print(f"  Regenerated: {', '.join(rebuilt) if rebuilt else 'nothing'}")
+    if stale:
+        print("ERROR: README section(s) match neither the base README nor freshly generated content:")
+        for marker in stale:
+            print(f"    - {marker}")
+        print("Run 'python scripts/generate_readme.py' to regenerate every section.")
+        sys.exit(1)
+
+    print()
+    print("All validations passed!")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+데이터 파일 감시 스크립트 (watch mode)
+
+data/ 와 data/schemas/ 를 폴링하면서 파일이 바뀔 때마다
+검증 -> README 섹션 -> 플롯 순서로 바뀐 부분만 다시 생성합니다.
+
+파싱된 데이터, 스키마 검증기, matplotlib 등은 프로세스가 살아있는 동안 재사용하므로
+validate_data.py / generate_readme.py / generate_plot.py를 매번 실행하는 것보다
+훨씬 빠릅니다. 외부 서비스나 inotify 없이 mtime 폴링만 사용합니다.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from generate_readme import (
+    generate_benchmark_section,
+    generate_last_updated,
+    generate_sample_gallery,
+    group_results_by_benchmark,
+    render_readme,
+)
+from validate_data import Draft7Validator, check_references, collect_schema_errors
+
+try:
+    from generate_plot import render_plot
+except ImportError:
+    render_plot = None  # matplotlib 미설치 시 플롯 생성 생략
+
+
+def load_json(path: Path) -> dict:
+    """JSON 파일 로드"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def cache_key(*parts) -> str:
+    """입력 데이터를 비교 가능한 문자열로 직렬화"""
+    return json.dumps(parts, ensure_ascii=False, sort_keys=True)
+
+
+def snapshot(data_dir: Path) -> dict[Path, tuple[int, int]]:
+    """data/ 아래 JSON 파일들의 (mtime_ns, size) 스냅샷"""
+    stats = {}
+    for path in data_dir.rglob("*.json"):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue  # 스캔 도중 삭제/교체된 파일
+        stats[path] = (st.st_mtime_ns, st.st_size)
+    return stats
+
+
+class Watcher:
+    """파싱된 데이터와 렌더링 결과를 메모리에 유지하며 증분 재생성"""
+
+    def __init__(self, root_dir: Path, plot: bool = True):
+        self.results_path = root_dir / "data" / "benchmarks" / "results.json"
+        self.samples_path = root_dir / "data" / "samples" / "samples.json"
+        self.readme_path = root_dir / "README.md"
+        self.plot_path = root_dir / "assets" / "images" / "note_f1_vs_delay.png"
+        self.schema_paths = {
+            self.results_path: root_dir / "data" / "schemas" / "benchmark.schema.json",
+            self.samples_path: root_dir / "data" / "schemas" / "sample.schema.json",
+        }
+        self.plot = plot and render_plot is not None
+
+        self.data = {}        # 데이터 파일 경로 -> 파싱된 JSON
+        self.validators = {}  # 스키마 파일 경로 -> Draft7Validator
+        self.errors = {}      # 검사 이름 -> 에러 메시지 리스트
+        self.sections = {}    # README 섹션 이름 -> 캐시 키
+        self.benchmark_blocks = {}  # 벤치마크 ID -> (캐시 키, Markdown)
+        self.plot_key = None
+
+    def reload(self, changed: set[Path]) -> list[str]:
+        """
+        바뀐 파일을 다시 읽고 영향받는 산출물만 재생성
+
+        Returns:
+            재생성한 항목 이름 리스트
+        """
+        # 스키마가 바뀌면 검증기 재생성 + 해당 데이터 파일 재검증
+        for data_path, schema_path in self.schema_paths.items():
+            if schema_path in changed or schema_path not in self.validators:
+                try:
+                    self.validators[schema_path] = Draft7Validator(load_json(schema_path))
+                except (FileNotFoundError, json.JSONDecodeError) as e:
+                    self.errors[schema_path.name] = [f"Invalid schema {schema_path}: {e}"]
+                    continue
+                self.errors.pop(schema_path.name, None)
+                changed.add(data_path)
+
+        last_good = dict(self.data)
+        data_changed = set()
+        for data_path in self.schema_paths:
+            if data_path not in changed and data_path in self.data:
+                continue
+            try:
+                new_data = load_json(data_path)
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                # 저장 도중일 수 있으므로 이전 데이터 유지
+                self.errors[data_path.name] = [f"Cannot load {data_path}: {e}"]
+                continue
+            self.data[data_path] = new_data
+            validator = self.validators.get(self.schema_paths[data_path])
+            self.errors[data_path.name] = (
+                collect_schema_errors(new_data, validator) if validator else []
+            )
+            data_changed.add(data_path)
+
+        if not data_changed or len(self.data) < len(self.schema_paths):
+            return []
+
+        results_data = self.data[self.results_path]
+        samples_data = self.data[self.samples_path]
+        try:
+            self.errors["cross-references"] = check_references(results_data, samples_data)
+            rebuilt = self.render_readme(results_data, samples_data)
+            if self.plot and self.results_path in data_changed:
+                rebuilt += self.render_plot(results_data)
+        except Exception as e:
+            # 스키마 위반 등으로 검사/렌더링이 불가능한 경우 - 마지막 정상 데이터를 유지하고
+            # 에러만 보고한 뒤 다음 변경을 기다림 (감시 프로세스는 계속 실행)
+            self.data = last_good
+            self.errors["render"] = [f"Cannot render: {type(e).__name__}: {e}"]
+            return []
+        self.errors.pop("render", None)
+        return rebuilt
+
+    def render_readme(self, results_data: dict, samples_data: dict) -> list[str]:
+        """입력이 바뀐 README 섹션만 다시 생성하고, 내용이 달라졌으면 저장"""
+        models = {m["id"]: m for m in results_data["models"]}
+        benchmarks = {b["id"]: b for b in results_data["benchmarks"]}
+        rebuilt = []
+
+        # 벤치마크 테이블은 벤치마크 단위로 캐시
+        # (캐시는 README 저장까지 성공한 뒤에 갱신 - 도중에 실패하면 다음 변경 때 다시 생성)
+        benchmark_blocks = {}
+        for benchmark_id, results in group_results_by_benchmark(results_data).items():
+            used_models = {r["model_id"]: models[r["model_id"]] for r in results}
+            key = cache_key(benchmarks[benchmark_id], results, used_models)
+            cached = self.benchmark_blocks.get(benchmark_id)
+            if cached is None or cached[0] != key:
+                cached = (key, generate_benchmark_section(benchmarks[benchmark_id], results, models))
+                rebuilt.append(f"table:{benchmark_id}")
+            benchmark_blocks[benchmark_id] = cached
+        blocks = [block for _, block in benchmark_blocks.values()]
+
+        candidates = {
+            "benchmark_table": (cache_key(blocks), lambda: "\n".join(blocks)),
+            "sample_gallery": (cache_key(samples_data), lambda: generate_sample_gallery(samples_data)),
+            "last_updated": (
+                cache_key(results_data.get("last_updated"), results_data.get("version")),
+                lambda: generate_last_updated(results_data),
+            ),
+        }
+        sections = {}
+        section_keys = {}
+        for name, (key, render) in candidates.items():
+            if self.sections.get(name) != key:
+                sections[name] = render()
+                section_keys[name] = key
+                if name != "benchmark_table":
+                    rebuilt.append(name)
+
+        if sections:
+            readme_content = self.readme_path.read_text(encoding="utf-8")
+            new_readme = render_readme(readme_content, sections)
+            if new_readme != readme_content:
+                self.readme_path.write_text(new_readme, encoding="utf-8")
+                rebuilt.append("README.md")
+
+        self.benchmark_blocks = benchmark_blocks
+        self.sections.update(section_keys)
+        return rebuilt
+
+    def render_plot(self, results_data: dict) -> list[str]:
+        """플롯에 쓰이는 값(모델 정보, note f1)이 바뀐 경우에만 플롯 재생성"""
+        key = cache_key(
+            [(m["id"], m["name"], m.get("delay_ms"), m.get("is_ours")) for m in results_data["models"]],
+            [(r["model_id"], r["metrics"]["note"]["f1"]) for r in results_data["benchmark_results"]],
+        )
+        if key == self.plot_key:
+            return []
+        render_plot(results_data, self.plot_path)
+        self.plot_key = key
+        return [self.plot_path.name]
+
+    def report(self, rebuilt: list[str], elapsed_ms: float) -> None:
+        """재생성 결과와 현재 검증 에러 출력"""
+        errors = [(name, e) for name, errs in self.errors.items() for e in errs]
+        stamp = time.strftime("%H:%M:%S")
+        summary = ", ".join(rebuilt) if rebuilt else "nothing to rebuild"
+        print(f"[{stamp}] {summary} ({elapsed_ms:.1f}ms)")
+        if errors:
+            print(f"  Validation FAILED with {len(errors)} error(s)")
+            for name, e in errors:
+                print(f"    - {name}: {e}")
+        else:
+            print("  All validations passed!")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Watch data/ and incrementally rebuild README sections and plots"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=0.25, help="Polling interval in seconds (default: 0.25)"
+    )
+    parser.add_argument("--no-plot", action="store_true", help="Do not regenerate the plot")
+    parser.add_argument("--once", action="store_true", help="Build once and exit")
+    args = parser.parse_args()
+
+    root_dir = Path(__file__).parent.parent
+    data_dir = root_dir / "data"
+
+    watcher = Watcher(root_dir, plot=not args.no_plot)
+    if not args.no_plot and render_plot is None:
+        print("Warning: matplotlib is not installed, plot generation disabled")
+
+    # 초기 빌드
+    stats = snapshot(data_dir)
+    start = time.perf_counter()
+    rebuilt = watcher.reload(set(stats))
+    watcher.report(rebuilt, (time.perf_counter() - start) * 1000)
+    if args.once:
+        sys.exit(1 if any(watcher.errors.values()) else 0)
+
+    print(f"Watching {data_dir} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(args.interval)
+            new_stats = snapshot(data_dir)
+            changed = {p for p in new_stats.keys() | stats.keys() if new_stats.get(p) != stats.get(p)}
+            stats = new_stats
+            if not changed:
+                continue
+            start = time.perf_counter()
+            rebuilt = watcher.reload(changed)
+            watcher.report(rebuilt, (time.perf_counter() - start) * 1000)
+    except KeyboardInterrupt:
+        print()
+
+
+if __name__ == "__main__":
+    main()